@@ -43,11 +43,9 @@ SPECIALS = {
     "quarterly": "*-01,04,07,10-01 00:00:00",
     "semiannually": "*-01,07-01 00:00:00",
 }
-# timedelta initialization is not cheap so we prepare a few constants
+# timedelta initialization is not cheap so we prepare a constant
 # that we will need often:
 SECOND = td(seconds=1)
-MINUTE = td(minutes=1)
-HOUR = td(hours=1)
 
 
 class OnCalendarError(Exception):
@@ -193,6 +191,28 @@ def is_imaginary(dt: datetime) -> bool:
     return dt != dt.astimezone(UTC).astimezone(dt.tzinfo)
 
 
+# The day-of-month field can contain values -31..31, all other fields contain
+# non-negative values only. When packing days into a bitmask, shift them by
+# DAY_OFFSET so negative days map to bits 0..30.
+DAY_OFFSET = 31
+
+
+def as_mask(values: set[int], offset: int = 0) -> int:
+    """Pack a set of integers into a bitmask.
+
+    Each value v in the set becomes the set bit `1 << (v + offset)`.
+    """
+    mask = 0
+    for v in values:
+        mask |= 1 << (v + offset)
+    return mask
+
+
+def from_mask(mask: int, offset: int = 0) -> frozenset[int]:
+    """Unpack a bitmask produced by `as_mask` back into a set of integers."""
+    return frozenset(i - offset for i in range(mask.bit_length()) if mask >> i & 1)
+
+
 class BaseIterator(object):
     """OnCalendar expression parser and iterator.
 
@@ -241,12 +261,12 @@ class BaseIterator(object):
             if len(time_parts) == 2:
                 # If seconds is missing, use default
                 time_parts.append("0")
-            self.hours = Field.HOUR.parse(time_parts[0])
-            self.minutes = Field.MINUTE.parse(time_parts[1])
-            self.seconds = Field.SECOND.parse(time_parts[2])
+            self.hours_mask = as_mask(Field.HOUR.parse(time_parts[0]))
+            self.minutes_mask = as_mask(Field.MINUTE.parse(time_parts[1]))
+            self.seconds_mask = as_mask(Field.SECOND.parse(time_parts[2]))
         else:
             # Default: 00:00:00
-            self.hours, self.minutes, self.seconds = {0}, {0}, {0}
+            self.hours_mask = self.minutes_mask = self.seconds_mask = 1
 
         if parts and "-" in parts[-1] and parts[-1][0] in "0123456789*":
             date_parts = parts.pop().split("-")
@@ -255,20 +275,20 @@ class BaseIterator(object):
             if len(date_parts) == 2:
                 # If year is missing, use default
                 date_parts.insert(0, "*")
-            self.years = Field.YEAR.parse(date_parts[0])
-            self.months = Field.MONTH.parse(date_parts[1])
-            self.days = Field.DAY.parse(date_parts[2])
+            self.years_mask = as_mask(Field.YEAR.parse(date_parts[0]))
+            self.months_mask = as_mask(Field.MONTH.parse(date_parts[1]))
+            self.days_mask = as_mask(Field.DAY.parse(date_parts[2]), DAY_OFFSET)
         else:
             # Default: *-*-*
-            self.years = set(RANGES[Field.YEAR])
-            self.months = set(RANGES[Field.MONTH])
-            self.days = set(RANGES[Field.DAY])
+            self.years_mask = as_mask(set(RANGES[Field.YEAR]))
+            self.months_mask = as_mask(set(RANGES[Field.MONTH]))
+            self.days_mask = as_mask(set(RANGES[Field.DAY]), DAY_OFFSET)
 
         if parts:
-            self.weekdays = Field.DOW.parse(parts.pop(0))
+            self.weekdays_mask = as_mask(Field.DOW.parse(parts.pop(0)))
         else:
             # Default: Mon..Sun
-            self.weekdays = set(RANGES[Field.DOW])
+            self.weekdays_mask = as_mask(set(RANGES[Field.DOW]))
 
         # There should be no parts left over
         if parts:
@@ -282,7 +302,43 @@ class BaseIterator(object):
             self.fixup_tz = self.dt.tzinfo
             self.dt = self.dt.replace(tzinfo=None)
 
-        self.any_reverse_day = any(d < 0 for d in self.days)
+        # Bits below DAY_OFFSET correspond to negative (reverse) days
+        self.any_reverse_day = bool(self.days_mask & ((1 << DAY_OFFSET) - 1))
+
+    @property
+    def weekdays(self) -> frozenset[int]:
+        """The accepted day-of-week values, as a set of integers."""
+        return from_mask(self.weekdays_mask)
+
+    @property
+    def years(self) -> frozenset[int]:
+        """The accepted year values, as a set of integers."""
+        return from_mask(self.years_mask)
+
+    @property
+    def months(self) -> frozenset[int]:
+        """The accepted month values, as a set of integers."""
+        return from_mask(self.months_mask)
+
+    @property
+    def days(self) -> frozenset[int]:
+        """The accepted day-of-month values, as a set of integers."""
+        return from_mask(self.days_mask, DAY_OFFSET)
+
+    @property
+    def hours(self) -> frozenset[int]:
+        """The accepted hour values, as a set of integers."""
+        return from_mask(self.hours_mask)
+
+    @property
+    def minutes(self) -> frozenset[int]:
+        """The accepted minute values, as a set of integers."""
+        return from_mask(self.minutes_mask)
+
+    @property
+    def seconds(self) -> frozenset[int]:
+        """The accepted second values, as a set of integers."""
+        return from_mask(self.seconds_mask)
 
     def advance_second(self) -> bool:
         """Roll forward the second component until it satisfies the constraints.
@@ -292,21 +348,19 @@ class BaseIterator(object):
 
         """
 
-        if self.dt.second in self.seconds:
+        if self.seconds_mask >> self.dt.second & 1:
             return False
 
-        if len(self.seconds) == 1:
-            # An optimization for the special case where self.seconds has exactly
-            # one element. Instead of advancing one second per iteration,
-            # make a jump from the current second to the target second.
-            delta = (next(iter(self.seconds)) - self.dt.second) % 60
-            self.dt += td(seconds=delta)
-
-        while self.dt.second not in self.seconds:
-            self.dt += SECOND
-            if self.dt.second == 0:
-                # Break out to re-check year, month, day, hour, and minute
-                break
+        # The bits in `upcoming` are the accepted seconds in the current minute,
+        # at and above the current second
+        upcoming = self.seconds_mask >> self.dt.second
+        if upcoming:
+            # Jump straight to the lowest set bit
+            self.dt += td(seconds=(upcoming & -upcoming).bit_length() - 1)
+        else:
+            # Jump to the next round minute, and break out to re-check
+            # year, month, day, hour, and minute
+            self.dt += td(seconds=60 - self.dt.second)
 
         return True
 
@@ -318,15 +372,17 @@ class BaseIterator(object):
 
         """
 
-        if self.dt.minute in self.minutes:
+        if self.minutes_mask >> self.dt.minute & 1:
             return False
 
         self.dt = self.dt.replace(second=0)
-        while self.dt.minute not in self.minutes:
-            self.dt += MINUTE
-            if self.dt.minute == 0:
-                # Break out to re-check year, month, day and hour
-                break
+        upcoming = self.minutes_mask >> self.dt.minute
+        if upcoming:
+            self.dt += td(minutes=(upcoming & -upcoming).bit_length() - 1)
+        else:
+            # Jump to the next round hour, and break out to re-check
+            # year, month, day and hour
+            self.dt += td(minutes=60 - self.dt.minute)
 
         return True
 
@@ -338,26 +394,28 @@ class BaseIterator(object):
 
         """
 
-        if self.dt.hour in self.hours:
+        if self.hours_mask >> self.dt.hour & 1:
             return False
 
         self.dt = self.dt.replace(minute=0, second=0)
-        while self.dt.hour not in self.hours:
-            self.dt += HOUR
-            if self.dt.hour == 0:
-                # break out to re-check year, month and day
-                break
+        upcoming = self.hours_mask >> self.dt.hour
+        if upcoming:
+            self.dt += td(hours=(upcoming & -upcoming).bit_length() - 1)
+        else:
+            # Jump to the next midnight, and break out to re-check
+            # year, month and day
+            self.dt += td(hours=24 - self.dt.hour)
 
         return True
 
     def match_dom(self, d: date) -> bool:
         """Return True is day-of-month matches."""
-        if d.day in self.days:
+        if self.days_mask >> (d.day + DAY_OFFSET) & 1:
             return True
 
         if self.any_reverse_day:
             _, last = monthrange(d.year, d.month)
-            if d.day - last - 1 in self.days:
+            if self.days_mask >> (d.day - last - 1 + DAY_OFFSET) & 1:
                 return True
 
         return False
@@ -365,7 +423,7 @@ class BaseIterator(object):
     def match_dow(self, d: date) -> bool:
         """Return True is day-of-week matches."""
 
-        return d.weekday() in self.weekdays
+        return bool(self.weekdays_mask >> d.weekday() & 1)
 
     def advance_day(self) -> bool:
         """Roll forward the day component until it satisfies the constraints.
@@ -400,11 +458,11 @@ class BaseIterator(object):
 
         """
 
-        if self.dt.month in self.months:
+        if self.months_mask >> self.dt.month & 1:
             return False
 
         needle = self.dt.date()
-        while needle.month not in self.months:
+        while not self.months_mask >> needle.month & 1:
             needle = (needle.replace(day=1) + td(days=32)).replace(day=1)
 
         self.dt = datetime.combine(needle, time(), tzinfo=self.dt.tzinfo)
@@ -418,14 +476,19 @@ class BaseIterator(object):
 
         """
 
-        if self.dt.year in self.years:
+        if self.years_mask >> self.dt.year & 1:
             return
 
-        needle = self.dt.date()
-        while needle.year not in self.years and needle.year < MAX_YEAR:
-            needle = needle.replace(year=needle.year + 1, month=1, day=1)
+        # The bits in `upcoming` are the accepted years at and above the
+        # current year. The mask has no bits at MAX_YEAR or above, so if
+        # `upcoming` is empty, jump to MAX_YEAR to stop the iteration.
+        upcoming = self.years_mask >> self.dt.year
+        if upcoming:
+            year = self.dt.year + (upcoming & -upcoming).bit_length() - 1
+        else:
+            year = MAX_YEAR
 
-        self.dt = datetime.combine(needle, time(), tzinfo=self.dt.tzinfo)
+        self.dt = datetime(year, 1, 1, tzinfo=self.dt.tzinfo)
 
     def __iter__(self) -> "BaseIterator":
         return self
@@ -1,47 +1,85 @@
 from __future__ import annotations
 
+import re
 import unittest
+from copy import copy
 from datetime import datetime
-from itertools import product
+from functools import lru_cache
+from itertools import islice, product
 from zoneinfo import ZoneInfo
 
 from oncalendar import BaseIterator, OnCalendarError
 
 NOW = datetime(2020, 1, 1)
+RIGA = ZoneInfo("Europe/Riga")
+NOW_RIGA = datetime(2020, 1, 1, tzinfo=RIGA)
+NOW_RIGA_OCT = datetime(2020, 10, 1, tzinfo=RIGA)
+
+# Precompiled error message patterns for assertRaisesRegex, so unittest
+# does not recompile them on every call:
+_RE_WRONG_FIELDS = re.compile("Wrong number of fields")
+_RE_BAD_DOM = re.compile("Bad day-of-month")
+_RE_BAD_DOW = re.compile("Bad day-of-week")
+_RE_BAD_MINUTE = re.compile("Bad minute")
+
+# Pre-built value sets, so tests don't rebuild them on every call.
+# frozenset compares equal to set, so these work with assertEqual.
+_ALL_HOURS = frozenset(range(0, 24))
+_ALL_MINUTES = frozenset(range(0, 60))
+_ALL_SECONDS = frozenset(range(0, 60))
+_ATTRS = {
+    "w": "weekdays",
+    "y": "years",
+    "m": "months",
+    "d": "days",
+    "H": "hours",
+    "M": "minutes",
+    "S": "seconds",
+}
+_DEFAULTS = {
+    "w": frozenset(range(0, 7)),
+    "y": frozenset(range(1970, 2200)),
+    "m": frozenset(range(1, 13)),
+    "d": frozenset(range(1, 32)),
+    "H": frozenset({0}),
+    "M": frozenset({0}),
+    "S": frozenset({0}),
+}
+
+
+@lru_cache(maxsize=None)
+def parse(expression: str, start: datetime = NOW) -> BaseIterator:
+    """Return a parsed BaseIterator, reusing the result for repeat arguments.
+
+    The returned object is shared between tests: reading its fields is fine,
+    but tests that iterate must copy() it first to avoid mutating the
+    cached state.
+    """
+    return BaseIterator(expression, start)
 
 
 class TestParse(unittest.TestCase):
-    def assert_default(self, w, fields):
-        if "w" in fields:
-            self.assertEqual(w.weekdays, set(range(0, 7)))
-        if "y" in fields:
-            self.assertEqual(w.years, set(range(1970, 2200)))
-        if "m" in fields:
-            self.assertEqual(w.months, set(range(1, 13)))
-        if "d" in fields:
-            self.assertEqual(w.days, set(range(1, 32)))
-        if "H" in fields:
-            self.assertEqual(w.hours, {0})
-        if "M" in fields:
-            self.assertEqual(w.minutes, {0})
-        if "S" in fields:
-            self.assertEqual(w.seconds, {0})
+    def assert_default(self, w: BaseIterator, fields: str) -> None:
+        expected = {_ATTRS[key]: _DEFAULTS[key] for key in fields}
+        actual = {attr: getattr(w, attr) for attr in expected}
+        self.assertEqual(actual, expected)
 
     def test_it_parses_stars(self) -> None:
-        w = BaseIterator("*-*-* *:*:*", NOW)
+        w = parse("*-*-* *:*:*")
         self.assert_default(w, "wymd")
-        self.assertEqual(w.hours, set(range(0, 24)))
-        self.assertEqual(w.minutes, set(range(0, 60)))
-        self.assertEqual(w.seconds, set(range(0, 60)))
+        self.assertEqual(w.hours, _ALL_HOURS)
+        self.assertEqual(w.minutes, _ALL_MINUTES)
+        self.assertEqual(w.seconds, _ALL_SECONDS)
 
     def test_it_parses_weekday(self) -> None:
         for sample in ("Mon", "MON", "Monday", "MONDAY"):
-            w = BaseIterator(sample, NOW)
-            self.assert_default(w, "ymdHMS")
-            self.assertEqual(w.weekdays, {0})
+            with self.subTest(sample=sample):
+                w = parse(sample)
+                self.assert_default(w, "ymdHMS")
+                self.assertEqual(w.weekdays, {0})
 
     def test_it_parses_weekday_with_trailing_comma(self) -> None:
-        w = BaseIterator("Mon, 12:34", NOW)
+        w = parse("Mon, 12:34")
         self.assert_default(w, "ymdS")
         self.assertEqual(w.weekdays, {0})
         self.assertEqual(w.hours, {12})
@@ -49,114 +87,116 @@ class TestParse(unittest.TestCase):
 
     def test_it_parses_weekday_interval(self) -> None:
         for sample in ("Mon..Tue", "Mon,Tue", "Mon-Tue"):
-            w = BaseIterator(sample, NOW)
-            self.assert_default(w, "ymdHMS")
-            self.assertEqual(w.weekdays, {0, 1})
+            with self.subTest(sample=sample):
+                w = parse(sample)
+                self.assert_default(w, "ymdHMS")
+                self.assertEqual(w.weekdays, {0, 1})
 
     def test_it_parses_date(self) -> None:
-        w = BaseIterator("2023-11-30", NOW)
+        w = parse("2023-11-30")
         self.assert_default(w, "wHMS")
         self.assertEqual(w.years, {2023})
         self.assertEqual(w.months, {11})
         self.assertEqual(w.days, {30})
 
     def test_it_handles_omitted_year(self) -> None:
-        w = BaseIterator("11-30", NOW)
+        w = parse("11-30")
         self.assert_default(w, "wyHMS")
         self.assertEqual(w.months, {11})
         self.assertEqual(w.days, {30})
 
     def test_it_handles_two_digit_year(self) -> None:
-        w = BaseIterator("69-*-*", NOW)
+        w = parse("69-*-*")
         self.assert_default(w, "wmdHMS")
         self.assertEqual(w.years, {2069})
 
     def test_it_handles_prev_century_two_digit_year(self) -> None:
-        w = BaseIterator("70-*-*", NOW)
+        w = parse("70-*-*")
         self.assert_default(w, "wmdHMS")
         self.assertEqual(w.years, {1970})
 
     def test_it_parses_time(self) -> None:
-        w = BaseIterator("11:22:33", NOW)
+        w = parse("11:22:33")
         self.assert_default(w, "wymd")
         self.assertEqual(w.hours, {11})
         self.assertEqual(w.minutes, {22})
         self.assertEqual(w.seconds, {33})
 
     def test_it_handles_omitted_seconds(self) -> None:
-        w = BaseIterator("11:22", NOW)
+        w = parse("11:22")
         self.assert_default(w, "wymdS")
         self.assertEqual(w.hours, {11})
         self.assertEqual(w.minutes, {22})
 
     def test_it_parses_list(self) -> None:
-        w = BaseIterator("*:1,2,3", NOW)
+        w = parse("*:1,2,3")
         self.assertEqual(w.minutes, {1, 2, 3})
 
     def test_it_parses_interval(self) -> None:
-        w = BaseIterator("*:1..3", NOW)
+        w = parse("*:1..3")
         self.assertEqual(w.minutes, {1, 2, 3})
 
     def test_it_parses_two_intervals(self) -> None:
-        w = BaseIterator("*:1..3,7..9:*", NOW)
+        w = parse("*:1..3,7..9:*")
         self.assertEqual(w.minutes, {1, 2, 3, 7, 8, 9})
 
     def test_it_parses_step(self) -> None:
-        w = BaseIterator("*:0/15", NOW)
+        w = parse("*:0/15")
         self.assertEqual(w.minutes, {0, 15, 30, 45})
 
     def test_it_parses_interval_with_step(self) -> None:
-        w = BaseIterator("*:0..10/2", NOW)
+        w = parse("*:0..10/2")
         self.assertEqual(w.minutes, {0, 2, 4, 6, 8, 10})
 
     def test_it_parses_start_with_step(self) -> None:
-        w = BaseIterator("*:5/15", NOW)
+        w = parse("*:5/15")
         self.assertEqual(w.minutes, {5, 20, 35, 50})
 
     def test_it_parses_negative_day(self) -> None:
-        w = BaseIterator("*-*~1", NOW)
+        w = parse("*-*~1")
         self.assertEqual(w.days, {-1})
 
     def test_it_parses_negative_day_sans_year(self) -> None:
-        w = BaseIterator("*~1", NOW)
+        w = parse("*~1")
         self.assertEqual(w.days, {-1})
 
     def test_it_parses_negative_day_list(self) -> None:
-        w = BaseIterator("*-*~1,8", NOW)
+        w = parse("*-*~1,8")
         self.assertEqual(w.days, {-1, -8})
 
     def test_it_parses_negative_day_interval(self) -> None:
-        w = BaseIterator("*-*~1..3", NOW)
+        w = parse("*-*~1..3")
         self.assertEqual(w.days, {-1, -2, -3})
 
     def test_it_parses_two_negative_day_intervals(self) -> None:
-        w = BaseIterator("*-*~1..2,4..5", NOW)
+        w = parse("*-*~1..2,4..5")
         self.assertEqual(w.days, {-1, -2, -4, -5})
 
     def test_it_parses_negative_day_interval_with_step(self) -> None:
-        w = BaseIterator("*-*~1..5/2", NOW)
+        w = parse("*-*~1..5/2")
         self.assertEqual(w.days, {-1, -3, -5})
 
     def test_it_parses_negative_day_start_with_step(self) -> None:
-        w = BaseIterator("*-*~3/2", NOW)
+        w = parse("*-*~3/2")
         self.assertEqual(w.days, {-1, -3})
 
     def test_it_parses_special_expression(self) -> None:
         for sample in ("minutely", "Minutely", "MINUTELY", "MiNuTeLY"):
-            w = BaseIterator(sample, NOW)
-            self.assert_default(w, "wymd")
-            self.assertEqual(w.hours, set(range(0, 24)))
-            self.assertEqual(w.minutes, set(range(0, 60)))
-            self.assertEqual(w.seconds, {0})
+            with self.subTest(sample=sample):
+                w = parse(sample)
+                self.assert_default(w, "wymd")
+                self.assertEqual(w.hours, _ALL_HOURS)
+                self.assertEqual(w.minutes, _ALL_MINUTES)
+                self.assertEqual(w.seconds, {0})
 
 
 class TestValidation(unittest.TestCase):
     def test_it_rejects_empty_string(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Wrong number of fields"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_WRONG_FIELDS):
             BaseIterator("", NOW)
 
     def test_it_rejects_4_components(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Wrong number of fields"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_WRONG_FIELDS):
             BaseIterator("Mon *-*-* *:*:* surprise", NOW)
 
     def test_it_rejects_bad_values(self) -> None:
@@ -184,71 +224,78 @@ class TestValidation(unittest.TestCase):
             "1..*",
         )
 
-        for pattern, s in product(patterns, bad_values):
-            with self.assertRaises(OnCalendarError):
-                BaseIterator(pattern % s, NOW)
+        # Split the patterns once, so the loop splices strings instead of
+        # re-parsing "%s" on every iteration.
+        compiled = [pattern.split("%s") for pattern in patterns]
+        for (head, tail), s in product(compiled, bad_values):
+            expr = head + s + tail
+            with self.subTest(expr=expr), self.assertRaises(OnCalendarError):
+                BaseIterator(expr, NOW)
 
     def test_it_rejects_lopsided_range(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Bad day-of-month"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_BAD_DOM):
             BaseIterator("*-*-5..1", NOW)
 
     def test_it_rejects_underscores(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Bad minute"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_BAD_MINUTE):
             BaseIterator("*:1..1_0", NOW)
 
     def test_it_rejects_zero_step(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Bad minute"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_BAD_MINUTE):
             BaseIterator("*:*/0", NOW)
 
     def test_it_checks_day_of_month_range(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Bad day-of-month"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_BAD_DOM):
             BaseIterator("1-32", NOW)
 
     def test_it_rejects_weekday_star(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Bad day-of-week"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_BAD_DOW):
             BaseIterator("* 1-1", NOW)
 
     def test_it_rejects_reverse_dom_above_28(self) -> None:
-        with self.assertRaisesRegex(OnCalendarError, "Bad day-of-month"):
+        with self.assertRaisesRegex(OnCalendarError, _RE_BAD_DOM):
             BaseIterator("1~29", NOW)
 
 
 class TestIterator(unittest.TestCase):
     def test_it_works_as_iterator(self) -> None:
-        hits = list(BaseIterator("2020-01-01 8..9:0:0", NOW))
+        hits = list(copy(parse("2020-01-01 8..9:0:0")))
         self.assertEqual(len(hits), 2)
         self.assertEqual(hits[0].isoformat(), "2020-01-01T08:00:00")
         self.assertEqual(hits[1].isoformat(), "2020-01-01T09:00:00")
 
     def test_it_handles_every_5th_second(self) -> None:
-        it = BaseIterator("*:*:0/5", NOW)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T00:00:05")
-        self.assertEqual(next(it).isoformat(), "2020-01-01T00:00:10")
+        hits = [d.isoformat() for d in islice(copy(parse("*:*:0/5")), 2)]
+        self.assertEqual(hits, ["2020-01-01T00:00:05", "2020-01-01T00:00:10"])
 
     def test_it_handles_every_minute(self) -> None:
-        it = BaseIterator("*:*", NOW)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T00:01:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-01T00:02:00")
+        hits = [d.isoformat() for d in islice(copy(parse("*:*")), 2)]
+        self.assertEqual(hits, ["2020-01-01T00:01:00", "2020-01-01T00:02:00"])
 
     def test_it_handles_every_feb_29_monday(self) -> None:
-        it = BaseIterator("Mon 2-29", NOW)
-        self.assertEqual(next(it).isoformat(), "2044-02-29T00:00:00")
-        self.assertEqual(next(it).isoformat(), "2072-02-29T00:00:00")
+        hits = [d.isoformat() for d in islice(copy(parse("Mon 2-29")), 2)]
+        self.assertEqual(hits, ["2044-02-29T00:00:00", "2072-02-29T00:00:00"])
 
     def test_it_handles_every_last_day_of_month(self) -> None:
-        it = BaseIterator("*~1", NOW)
-        self.assertEqual(next(it).isoformat(), "2020-01-31T00:00:00")
-        self.assertEqual(next(it).isoformat(), "2020-02-29T00:00:00")
-        self.assertEqual(next(it).isoformat(), "2020-03-31T00:00:00")
+        hits = [d.isoformat() for d in islice(copy(parse("*~1")), 3)]
+        expected = [
+            "2020-01-31T00:00:00",
+            "2020-02-29T00:00:00",
+            "2020-03-31T00:00:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_handles_last_sunday_of_every_month(self) -> None:
-        it = BaseIterator("Sun *~7/1", NOW)
-        self.assertEqual(next(it).isoformat(), "2020-01-26T00:00:00")
-        self.assertEqual(next(it).isoformat(), "2020-02-23T00:00:00")
-        self.assertEqual(next(it).isoformat(), "2020-03-29T00:00:00")
+        hits = [d.isoformat() for d in islice(copy(parse("Sun *~7/1")), 3)]
+        expected = [
+            "2020-01-26T00:00:00",
+            "2020-02-23T00:00:00",
+            "2020-03-29T00:00:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_handles_no_occurences(self) -> None:
-        it = BaseIterator("2019-01-01", NOW)
+        it = copy(parse("2019-01-01"))
         with self.assertRaises(StopIteration):
             print(next(it))
 
@@ -258,30 +305,33 @@ class TestIterator(unittest.TestCase):
 
 
 class TestDstHandling(unittest.TestCase):
-    tz = ZoneInfo("Europe/Riga")
-
     def test_it_preserves_timezone(self) -> None:
-        now = datetime(2020, 1, 1, tzinfo=self.tz)
-
-        it = BaseIterator("*:*", now)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T00:01:00+02:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-01T00:02:00+02:00")
+        hits = [d.isoformat() for d in islice(copy(parse("*:*", NOW_RIGA)), 2)]
+        expected = [
+            "2020-01-01T00:01:00+02:00",
+            "2020-01-01T00:02:00+02:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_handles_spring_dst(self) -> None:
-        now = datetime(2020, 1, 1, tzinfo=self.tz)
-
-        it = BaseIterator("*-*-29 3:30", now)
-        self.assertEqual(next(it).isoformat(), "2020-01-29T03:30:00+02:00")
-        self.assertEqual(next(it).isoformat(), "2020-02-29T03:30:00+02:00")
-        self.assertEqual(next(it).isoformat(), "2020-04-29T03:30:00+03:00")
+        it = copy(parse("*-*-29 3:30", NOW_RIGA))
+        hits = [d.isoformat() for d in islice(it, 3)]
+        expected = [
+            "2020-01-29T03:30:00+02:00",
+            "2020-02-29T03:30:00+02:00",
+            "2020-04-29T03:30:00+03:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_handles_autumn_dst(self) -> None:
-        now = datetime(2020, 10, 1, tzinfo=self.tz)
-
-        it = BaseIterator("*-*-25 3:30", now)
-        self.assertEqual(next(it).isoformat(), "2020-10-25T03:30:00+03:00")
-        self.assertEqual(next(it).isoformat(), "2020-11-25T03:30:00+02:00")
-        self.assertEqual(next(it).isoformat(), "2020-12-25T03:30:00+02:00")
+        it = copy(parse("*-*-25 3:30", NOW_RIGA_OCT))
+        hits = [d.isoformat() for d in islice(it, 3)]
+        expected = [
+            "2020-10-25T03:30:00+03:00",
+            "2020-11-25T03:30:00+02:00",
+            "2020-12-25T03:30:00+02:00",
+        ]
+        self.assertEqual(hits, expected)
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import unittest
 from datetime import datetime, timezone
+from itertools import islice
 from zoneinfo import ZoneInfo
 
 from oncalendar import OnCalendar, OnCalendarError
@@ -13,10 +14,14 @@ class TestTzIterator(unittest.TestCase):
     def test_it_works(self) -> None:
         now = datetime(2020, 1, 1, tzinfo=timezone.utc)
         it = OnCalendar("00:00\n12:34", now)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T12:34:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-02T00:00:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-02T12:34:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-03T00:00:00+00:00")
+        hits = [d.isoformat() for d in islice(it, 4)]
+        expected = [
+            "2020-01-01T12:34:00+00:00",
+            "2020-01-02T00:00:00+00:00",
+            "2020-01-02T12:34:00+00:00",
+            "2020-01-03T00:00:00+00:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_works_as_iterator(self) -> None:
         now = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -33,10 +38,14 @@ class TestTzIterator(unittest.TestCase):
     def test_it_handles_subiterator_stopiteration(self) -> None:
         now = datetime(2020, 1, 1, tzinfo=timezone.utc)
         it = OnCalendar("2020-01-02\n12:34", now)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T12:34:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-02T00:00:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-02T12:34:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-03T12:34:00+00:00")
+        hits = [d.isoformat() for d in islice(it, 4)]
+        expected = [
+            "2020-01-01T12:34:00+00:00",
+            "2020-01-02T00:00:00+00:00",
+            "2020-01-02T12:34:00+00:00",
+            "2020-01-03T12:34:00+00:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_handles_no_occurences(self) -> None:
         now = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import unittest
 from datetime import datetime, timezone
+from itertools import islice
 from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
@@ -20,19 +21,31 @@ class TestTzIterator(unittest.TestCase):
     def test_it_handles_no_timezone(self) -> None:
         for sample in ("12:34", "*-*-* 12:34"):
             it = TzIterator(sample, NOW)
-            self.assertEqual(next(it).isoformat(), "2020-01-01T12:34:00+00:00")
-            self.assertEqual(next(it).isoformat(), "2020-01-02T12:34:00+00:00")
+            hits = [d.isoformat() for d in islice(it, 2)]
+            expected = [
+                "2020-01-01T12:34:00+00:00",
+                "2020-01-02T12:34:00+00:00",
+            ]
+            self.assertEqual(hits, expected)
 
     def test_it_parses_timezone_from_schedule(self) -> None:
         it = TzIterator("12:34 Europe/Riga", NOW)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T10:34:00+00:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-02T10:34:00+00:00")
+        hits = [d.isoformat() for d in islice(it, 2)]
+        expected = [
+            "2020-01-01T10:34:00+00:00",
+            "2020-01-02T10:34:00+00:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_preserves_local_timezone(self) -> None:
         now = datetime(2020, 1, 1, tzinfo=ZoneInfo("Europe/Berlin"))
         it = TzIterator("12:34 Europe/Riga", now)
-        self.assertEqual(next(it).isoformat(), "2020-01-01T11:34:00+01:00")
-        self.assertEqual(next(it).isoformat(), "2020-01-02T11:34:00+01:00")
+        hits = [d.isoformat() for d in islice(it, 2)]
+        expected = [
+            "2020-01-01T11:34:00+01:00",
+            "2020-01-02T11:34:00+01:00",
+        ]
+        self.assertEqual(hits, expected)
 
     def test_it_requires_aware_datetime(self) -> None:
         now = datetime(2020, 1, 1)